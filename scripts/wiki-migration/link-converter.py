@@ -7,9 +7,35 @@ Converts markdown file links to GitHub Wiki format
 import re
 import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Tuple
 
+# Link patterns, compiled once since they run against every documentation file
+MARKDOWN_LINK_PATTERN = re.compile(r'\[([^\]]+)\]\(([^)]+)\)')
+# Internal .md link target, optionally prefixed with ./, ../ or ../../
+INTERNAL_LINK_PATTERN = re.compile(r'\]\((?P<prefix>\./|\.\./(?:\.\./)?)?(?P<target>[^)]+)\.md\)')
+
+# Title-cased acronyms restored to upper case in wiki titles
+ACRONYM_MAPPING = {
+    'Api': 'API',
+    'Kpi': 'KPI',
+    'Prd': 'PRD',
+    'Ui': 'UI',
+    'Ux': 'UX',
+    'Pwa': 'PWA',
+    'Sql': 'SQL',
+    'Html': 'HTML',
+    'Css': 'CSS',
+    'Json': 'JSON',
+    'Http': 'HTTP',
+    'Https': 'HTTPS',
+    'Aws': 'AWS',
+    'Gcp': 'GCP'
+}
+# Longest first so 'Https' wins over its prefix 'Http'
+ACRONYM_PATTERN = re.compile('|'.join(sorted(ACRONYM_MAPPING, key=len, reverse=True)))
+
 def convert_filename_to_wiki_title(filename: str) -> str:
     """Convert a filename to wiki page title format"""
     # Remove .md extension
@@ -19,25 +45,7 @@ def convert_filename_to_wiki_title(filename: str) -> str:
     title = name.replace('-', ' ').title().replace(' ', '-')
 
     # Handle special cases
-    title_mapping = {
-        'Api': 'API',
-        'Kpi': 'KPI',
-        'Prd': 'PRD',
-        'Ui': 'UI',
-        'Ux': 'UX',
-        'Pwa': 'PWA',
-        'Sql': 'SQL',
-        'Html': 'HTML',
-        'Css': 'CSS',
-        'Json': 'JSON',
-        'Http': 'HTTP',
-        'Https': 'HTTPS',
-        'Aws': 'AWS',
-        'Gcp': 'GCP'
-    }
-
-    for old, new in title_mapping.items():
-        title = title.replace(old, new)
+    title = ACRONYM_PATTERN.sub(lambda m: ACRONYM_MAPPING[m.group(0)], title)
 
     return title
 
@@ -47,33 +55,24 @@ def extract_links_from_file(file_path: Path) -> List[Tuple[str, str]]:
         content = f.read()
 
     # Pattern for markdown links: [text](url)
-    pattern = r'\[([^\]]+)\]\(([^)]+)\)'
-    matches = re.findall(pattern, content)
+    matches = MARKDOWN_LINK_PATTERN.findall(content)
 
     return matches
 
 def convert_link_patterns(content: str) -> str:
     """Convert various internal link patterns to wiki format"""
+    return INTERNAL_LINK_PATTERN.sub(_convert_internal_link, content)
 
-    # Pattern 1: Relative file links ./filename.md
-    content = re.sub(r'\]\(\./([^)]+)\.md\)', r'](\1)', content)
-
-    # Pattern 2: Parent directory links ../filename.md
-    content = re.sub(r'\]\(\.\./([^)]+)\.md\)', r'](\1)', content)
-
-    # Pattern 3: Nested directory links ../dir/filename.md
-    content = re.sub(r'\]\(\.\./([^/]+)/([^)]+)\.md\)', lambda m: f']({convert_filename_to_wiki_title(m.group(2))})', content)
-
-    # Pattern 4: Double parent directory ../../filename.md
-    content = re.sub(r'\]\(\.\./\.\./([^)]+)\.md\)', r'](\1)', content)
-
-    # Pattern 5: Directory/file patterns ./dir/filename.md
-    content = re.sub(r'\]\(\./([^/]+)/([^)]+)\.md\)', lambda m: f']({convert_filename_to_wiki_title(m.group(2))})', content)
+def _convert_internal_link(match: re.Match) -> str:
+    """Rewrite a single internal link matched by INTERNAL_LINK_PATTERN"""
+    target = match.group('target')
 
-    # Pattern 6: Simple filename.md (no path)
-    content = re.sub(r'\]\(([^)]+)\.md\)', lambda m: f']({convert_filename_to_wiki_title(m.group(1))})', content)
+    # Relative links ./file.md, ../file.md, ../../file.md drop the prefix and keep the rest of the path
+    if match.group('prefix'):
+        return f']({target})'
 
-    return content
+    # Bare filename.md links become the wiki page title
+    return f']({convert_filename_to_wiki_title(target)})'
 
 def add_wiki_metadata(content: str, title: str, category: str) -> str:
     """Add wiki-appropriate metadata to content"""
@@ -143,14 +142,15 @@ def process_file(input_path: Path, output_path: Path, category: str = "Documenta
             f.write(final_content)
 
         # Extract metrics
-        original_links = len(re.findall(r'\[([^\]]+)\]\(([^)]+)\)', content))
-        converted_links = len(re.findall(r'\[([^\]]+)\]\(([^)]+)\)', final_content))
+        original_links = len(MARKDOWN_LINK_PATTERN.findall(content))
+        converted_links = len(MARKDOWN_LINK_PATTERN.findall(final_content))
 
         return {
             'success': True,
             'original_file': str(input_path),
             'wiki_file': str(output_path),
             'wiki_title': wiki_title,
+            'category': category,
             'original_links': original_links,
             'converted_links': converted_links,
             'content_length': len(final_content)
@@ -163,6 +163,19 @@ def process_file(input_path: Path, output_path: Path, category: str = "Documenta
             'error': str(e)
         }
 
+def _is_markdown_file(entry: os.DirEntry) -> bool:
+    """Check whether a directory entry is a markdown file"""
+    return entry.name.endswith('.md') and entry.is_file()
+
+def list_markdown_files(dir_path: Path) -> List[Path]:
+    """List the markdown files directly inside a directory"""
+    with os.scandir(dir_path) as entries:
+        return [Path(entry.path) for entry in entries if _is_markdown_file(entry)]
+
+def _process_file_task(task: Tuple[Path, Path, str]) -> Dict[str, any]:
+    """Process an (input_path, output_path, category) task in a worker process"""
+    return process_file(*task)
+
 def main():
     """Main conversion process"""
 
@@ -179,6 +192,10 @@ def main():
     print(f"Output: {output_dir}")
     print("---")
 
+    if not input_dir.is_dir():
+        print(f"❌ Input directory not found: {input_dir}")
+        sys.exit(1)
+
     # Create output directory
     output_dir.mkdir(parents=True, exist_ok=True)
 
@@ -193,55 +210,60 @@ def main():
         'guides': 'Development Guides'
     }
 
-    # Process all markdown files
+    # Scan the input directory once, splitting category subdirectories from root files
+    excluded_root_files = {'README.md', 'CLAUDE.md', 'CLAUDE.local.md'}
+    category_dirs = {}
+    root_files = []
+
+    with os.scandir(input_dir) as entries:
+        for entry in entries:
+            if entry.name in category_mapping and entry.is_dir():
+                category_dirs[entry.name] = Path(entry.path)
+            elif entry.name not in excluded_root_files and _is_markdown_file(entry):
+                root_files.append(Path(entry.path))
+
+    # Collect all markdown files, then convert them in parallel. Tasks are keyed
+    # by output path so no two workers ever write the same wiki file.
+    tasks = {}
     processed_files = []
     failed_files = []
 
-    def process_directory(dir_path: Path, category: str):
-        """Process all markdown files in a directory"""
-
-        if not dir_path.exists():
-            print(f"⚠️  Directory not found: {dir_path}")
-            return
-
-        print(f"📁 Processing {category}...")
+    def queue_files(files: List[Path], category: str):
+        """Queue markdown files for conversion under a category"""
 
-        for md_file in dir_path.glob("*.md"):
+        for md_file in files:
             wiki_filename = convert_filename_to_wiki_title(md_file.stem) + ".md"
             output_path = output_dir / wiki_filename
 
             print(f"  📄 {md_file.name} → {wiki_filename}")
 
-            result = process_file(md_file, output_path, category)
+            if output_path in tasks:
+                # Sequential conversion let the last file win, so keep that behaviour
+                print(f"    ⚠️  Overrides {tasks[output_path][0]} (same wiki title)")
 
-            if result['success']:
-                processed_files.append(result)
-            else:
-                failed_files.append(result)
-                print(f"    ❌ Error: {result['error']}")
+            tasks[output_path] = (md_file, output_path, category)
 
     # Process main documentation directories
     for subdir, category in category_mapping.items():
-        dir_path = input_dir / subdir
-        process_directory(dir_path, category)
+        if subdir not in category_dirs:
+            print(f"⚠️  Directory not found: {input_dir / subdir}")
+            continue
+
+        print(f"📁 Processing {category}...")
+        queue_files(list_markdown_files(category_dirs[subdir]), category)
 
     # Process root-level documentation files
     print("📁 Processing root documentation files...")
-    root_files = [f for f in input_dir.glob("*.md") if f.name not in ['README.md', 'CLAUDE.md', 'CLAUDE.local.md']]
+    queue_files(root_files, "Project Documentation")
 
-    for md_file in root_files:
-        wiki_filename = convert_filename_to_wiki_title(md_file.stem) + ".md"
-        output_path = output_dir / wiki_filename
-
-        print(f"  📄 {md_file.name} → {wiki_filename}")
-
-        result = process_file(md_file, output_path, "Project Documentation")
-
-        if result['success']:
-            processed_files.append(result)
-        else:
-            failed_files.append(result)
-            print(f"    ❌ Error: {result['error']}")
+    # Each file is independent, so spread the regex and I/O work across cores
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        for result in executor.map(_process_file_task, tasks.values(), chunksize=8):
+            if result['success']:
+                processed_files.append(result)
+            else:
+                failed_files.append(result)
+                print(f"  ❌ Error in {result['original_file']}: {result['error']}")
 
     # Generate summary report
     print("\n📊 Conversion Summary:")
@@ -260,20 +282,7 @@ def main():
     # Group by category
     by_category = {}
     for file_info in processed_files:
-        category = "Unknown"
-        # Extract category from content if possible
-        try:
-            with open(file_info['wiki_file'], 'r') as f:
-                content = f.read()
-                match = re.search(r'\*\*Category\*\*:\s*([^\n]+)', content)
-                if match:
-                    category = match.group(1).strip()
-        except:
-            pass
-
-        if category not in by_category:
-            by_category[category] = []
-        by_category[category].append(file_info)
+        by_category.setdefault(file_info['category'], []).append(file_info)
 
     for category, files in by_category.items():
         index_content += f"## {category}\n\n"